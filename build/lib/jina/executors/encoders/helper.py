@@ -0,0 +1,126 @@
+__copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
+__license__ = "Apache-2.0"
+
+import numpy as np
+
+
+def pack_tokens(data, mask_2d):
+    """Drop the padded positions of ``data`` and return the valid tokens as one packed array
+
+    :param data: a `B x S x D` array of token embeddings
+    :param mask_2d: a `B x S` mask, non-zero for the valid tokens
+    :return: a tuple of the `sum(mask) x D` packed array, the start offset of each sequence
+        inside it and the number of valid tokens per sequence
+    """
+    valid = mask_2d.astype(bool)
+    seq_lens = valid.sum(axis=1)
+    offsets = np.concatenate(([0], np.cumsum(seq_lens)[:-1]))
+    return data[valid], offsets, seq_lens
+
+
+def reduce_mean(data, mask_2d):
+    packed, offsets, seq_lens = pack_tokens(data, mask_2d)
+    output = np.add.reduceat(packed, offsets, axis=0)
+    return output / np.maximum(seq_lens, 1)[:, np.newaxis]
+
+
+def reduce_max(data, mask_2d):
+    packed, offsets, _ = pack_tokens(data, mask_2d)
+    return np.maximum.reduceat(packed, offsets, axis=0)
+
+
+def reduce_min(data, mask_2d):
+    packed, offsets, _ = pack_tokens(data, mask_2d)
+    return np.minimum.reduceat(packed, offsets, axis=0)
+
+
+_numba_pool_fns = None
+
+
+def get_numba_pool_fn(pool_strategy: str):
+    """Return a numba-compiled single-pass pooling function for ``pool_strategy``, or
+    ``None`` when numba is not installed or the strategy has no kernel.
+
+    Unlike the numpy helpers above, the kernels fuse the masking, the reduction and
+    (for ``mean``) the division into one pass over the `B x S x D` buffer and
+    parallelize over the batch dim.
+    """
+    global _numba_pool_fns
+    if _numba_pool_fns is None:
+        try:
+            _numba_pool_fns = _compile_numba_pool_fns()
+        except ImportError:
+            _numba_pool_fns = {}
+    return _numba_pool_fns.get(pool_strategy)
+
+
+def _compile_numba_pool_fns():
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mean_kernel(data, mask_2d, out):
+        for b in prange(data.shape[0]):
+            cnt = 0
+            for d in range(data.shape[2]):
+                out[b, d] = 0.
+            for t in range(data.shape[1]):
+                if mask_2d[b, t]:
+                    cnt += 1
+                    for d in range(data.shape[2]):
+                        out[b, d] += data[b, t, d]
+            denom = cnt if cnt > 0 else 1
+            for d in range(data.shape[2]):
+                out[b, d] /= denom
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _max_kernel(data, mask_2d, out):
+        for b in prange(data.shape[0]):
+            for d in range(data.shape[2]):
+                out[b, d] = -np.inf
+            for t in range(data.shape[1]):
+                if mask_2d[b, t]:
+                    for d in range(data.shape[2]):
+                        if data[b, t, d] > out[b, d]:
+                            out[b, d] = data[b, t, d]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _min_kernel(data, mask_2d, out):
+        for b in prange(data.shape[0]):
+            for d in range(data.shape[2]):
+                out[b, d] = np.inf
+            for t in range(data.shape[1]):
+                if mask_2d[b, t]:
+                    for d in range(data.shape[2]):
+                        if data[b, t, d] < out[b, d]:
+                            out[b, d] = data[b, t, d]
+
+    def _as_pool_fn(kernel):
+        def _fn(data, mask_2d):
+            out = np.empty((data.shape[0], data.shape[2]), dtype=data.dtype)
+            kernel(data, mask_2d.astype(np.bool_), out)
+            return out
+
+        return _fn
+
+    return {
+        'mean': _as_pool_fn(_mean_kernel),
+        'max': _as_pool_fn(_max_kernel),
+        'min': _as_pool_fn(_min_kernel)
+    }
+
+
+def reduce_cls(data, mask_2d, cls_pos='head'):
+    mask_pruned = prune_mask(mask_2d, cls_pos)
+    return reduce_mean(data, mask_pruned)
+
+
+def prune_mask(mask, cls_pos='head'):
+    result = np.zeros(mask.shape)
+    if cls_pos == 'head':
+        result[:, 0] = 1
+    elif cls_pos == 'tail':
+        seq_lens = np.sum(mask, axis=1).astype(int)
+        result[np.arange(mask.shape[0]), seq_lens - 1] = 1
+    else:
+        raise NotImplementedError
+    return result
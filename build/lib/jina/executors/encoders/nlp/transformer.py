@@ -0,0 +1,531 @@
+__copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
+__license__ = "Apache-2.0"
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ..helper import get_numba_pool_fn
+from ...decorators import batching, as_ndarray
+from ...frameworks import BaseFrameworkExecutor, BaseTorchExecutor, BaseTFExecutor
+
+#: tokenization is deterministic, so token ids of recently seen strings can be reused;
+#: at the default max_length the cache tops out at a few dozen MB
+_TOK_CACHE_CAPACITY = 65536
+
+#: the transformers classes backing each supported model, kept as names so that only the
+#: class matching the selected model is imported at init time. The fast rust-backed
+#: tokenizers are preferred, the slow python ones remain for the models without one.
+_TOKENIZER_CLS = {
+    'bert-base-uncased': 'BertTokenizerFast',
+    'openai-gpt': 'OpenAIGPTTokenizerFast',
+    'gpt2': 'GPT2TokenizerFast',
+    'xlnet-base-cased': 'XLNetTokenizerFast',
+    'xlm-mlm-enfr-1024': 'XLMTokenizer',
+    'distilbert-base-cased': 'DistilBertTokenizerFast',
+    'roberta-base': 'RobertaTokenizerFast',
+    'xlm-roberta-base': 'XLMRobertaTokenizerFast',
+    'flaubert-base-cased': 'FlaubertTokenizer',
+    'camembert-base': 'CamembertTokenizerFast',
+    'ctrl': 'CTRLTokenizer'
+}
+
+_TF_MODEL_CLS = {
+    'bert-base-uncased': 'TFBertModel',
+    'openai-gpt': 'TFOpenAIGPTModel',
+    'gpt2': 'TFGPT2Model',
+    'xlnet-base-cased': 'TFXLNetModel',
+    'xlm-mlm-enfr-1024': 'TFXLMModel',
+    'distilbert-base-cased': 'TFDistilBertModel',
+    'roberta-base': 'TFRobertaModel',
+    'xlm-roberta-base': 'TFXLMRobertaModel',
+    'camembert-base': 'TFCamembertModel',
+    'ctrl': 'TFCTRLModel'
+}
+
+_TORCH_MODEL_CLS = {
+    'bert-base-uncased': 'BertModel',
+    'openai-gpt': 'OpenAIGPTModel',
+    'gpt2': 'GPT2Model',
+    'xlnet-base-cased': 'XLNetModel',
+    'xlm-mlm-enfr-1024': 'XLMModel',
+    'distilbert-base-cased': 'DistilBertModel',
+    'roberta-base': 'RobertaModel',
+    'xlm-roberta-base': 'XLMRobertaModel',
+    'flaubert-base-cased': 'FlaubertModel',
+    'camembert-base': 'CamembertModel',
+    'ctrl': 'CTRLModel'
+}
+
+
+def _get_transformers_class(class_name: str):
+    """Import and return a single class from the lazily-loaded ``transformers`` package"""
+    import importlib
+    return getattr(importlib.import_module('transformers'), class_name)
+
+
+class BaseTransformerEncoder(BaseFrameworkExecutor):
+    """
+    :class:`TransformerTextEncoder` encodes data from an array of string in size `B` into an ndarray in size `B x D`.
+    """
+
+    def __init__(self,
+                 model_name: str = 'bert-base-uncased',
+                 pooling_strategy: str = 'mean',
+                 max_length: int = 64,
+                 model_path: str = 'transformer',
+                 num_length_buckets: int = 1,
+                 quantize_model: bool = False,
+                 *args, **kwargs):
+        """
+
+        :param model_name: the name of the model. Supported models include 'bert-base-uncased', 'openai-gpt', 'gpt2',
+            'xlm-mlm-enfr-1024', 'distilbert-base-cased', 'roberta-base', 'xlm-roberta-base', 'flaubert-base-cased',
+            'camembert-base', 'ctrl'.
+        :param pooling_strategy: the strategy to merge the word embeddings into the chunk embedding. Supported
+            strategies include 'cls', 'mean', 'max', 'min'.
+        :param max_length: the max length to truncate the tokenized sequences to.
+        :param model_path: the path of the encoder model. If a valid path is given, the encoder will be loaded from the
+            given path.
+        :param num_length_buckets: the number of buckets for grouping the sequences by their tokenized length before
+            feeding them to the model. Each bucket is padded only to its own longest sequence, which saves the
+            model from running over the padding of the short sequences. Set to 1 to run the whole batch at once.
+        :param quantize_model: if set, run the model with int8 weights. This cuts the weight footprint and the
+            memory traffic roughly 4x at a small accuracy cost. Only supported by
+            :class:`TransformerTorchEncoder`; ignored by the other backends.
+        """
+        super().__init__(*args, **kwargs)
+        self.model_name = model_name
+        self.pooling_strategy = pooling_strategy
+        self.max_length = max_length
+        self.raw_model_path = model_path
+        self.num_length_buckets = num_length_buckets
+        self.quantize_model = quantize_model
+
+    def _init_tokenizer(self):
+        if self.model_name not in _TOKENIZER_CLS:
+            self.logger.error('{} not in our supports: {}'.format(self.model_name, ','.join(_TOKENIZER_CLS.keys())))
+            raise ValueError
+
+        self._tmp_model_path = self.model_name
+        if os.path.exists(self.model_abspath):
+            self._tmp_model_path = self.model_abspath
+
+        self.tokenizer = _get_transformers_class(
+            _TOKENIZER_CLS[self.model_name]).from_pretrained(self._tmp_model_path)
+        self.tokenizer.padding_side = 'right'
+
+        if self.model_name in (
+                'bert-base-uncased', 'distilbert-base-cased', 'roberta-base', 'xlm-roberta-base', 'flaubert-base-cased',
+                'camembert-base'):
+            self.cls_pos = 'head'
+        elif self.model_name in ('xlnet-base-cased'):
+            self.cls_pos = 'tail'
+
+        if self.model_name in ('openai-gpt', 'gpt2', 'xlm-mlm-enfr-1024', 'xlnet-base-cased'):
+            self.tokenizer.pad_token = '<PAD>'
+
+    @batching
+    @as_ndarray
+    def encode(self, data: 'np.ndarray', *args, **kwargs) -> 'np.ndarray':
+        """
+
+        :param data: a 1d array of string type in size `B`
+        :return: an ndarray in size `B x D`
+        """
+        texts = data.tolist()
+        if self.num_length_buckets <= 1:
+            inputs = self._prepare_inputs_direct(texts)
+            if inputs is not None:
+                return self._forward_inputs(inputs)
+            return self._encode_token_ids(self._tokenize(texts))
+        token_ids = self._tokenize(texts)
+        # group the sequences by length so that each bucket only pays for its own longest sequence
+        order = np.argsort([len(t) for t in token_ids], kind='stable')
+        buckets = [b for b in np.array_split(order, self.num_length_buckets) if b.size > 0]
+        output = None
+        for bucket, _output in zip(buckets, self._encode_buckets(token_ids, buckets)):
+            if output is None:
+                output = np.empty((len(token_ids), _output.shape[1]), dtype=_output.dtype)
+            output[bucket] = _output
+        return output
+
+    def _encode_buckets(self, token_ids, buckets):
+        """Run the model bucket by bucket and yield the pooled output of each one.
+
+        On GPU the host-side work of the next bucket (padding the buffers and queueing the
+        device copies) runs on a background thread while the current bucket is in the model,
+        so the CPU and the device are never idle waiting for each other.
+        """
+        if self._prefetch_pool is None or len(buckets) == 1:
+            for bucket in buckets:
+                yield self._forward_inputs(self._prepare_inputs([token_ids[b] for b in bucket]))
+            return
+        pending = self._prefetch_pool.submit(self._prepare_inputs, [token_ids[b] for b in buckets[0]])
+        for nxt in buckets[1:]:
+            inputs = pending.result()
+            pending = self._prefetch_pool.submit(self._prepare_inputs, [token_ids[b] for b in nxt])
+            yield self._forward_inputs(inputs)
+        yield self._forward_inputs(pending.result())
+
+    def _tokenize(self, texts):
+        """Tokenize ``texts``, reusing the cached token ids of the strings seen before
+
+        :param texts: a list of raw strings
+        :return: a list of int32 ndarrays of token ids, one per string
+        """
+        cache = self._tok_cache
+        miss_idx = [idx for idx, t in enumerate(texts) if t not in cache]
+        if miss_idx:
+            encoded = self.tokenizer([texts[idx] for idx in miss_idx],
+                                     truncation=True,
+                                     max_length=self.max_length)['input_ids']
+            for idx, ids in zip(miss_idx, encoded):
+                cache[texts[idx]] = np.asarray(ids, dtype=np.int32)
+            while len(cache) > _TOK_CACHE_CAPACITY:
+                cache.popitem(last=False)
+        token_ids = []
+        for t in texts:
+            cache.move_to_end(t)
+            token_ids.append(cache[t])
+        return token_ids
+
+    def _encode_token_ids(self, token_ids) -> 'np.ndarray':
+        """Pad ``token_ids`` to the longest sequence among them and run the model
+
+        :param token_ids: a list of token id lists with heterogeneous lengths
+        :return: an ndarray in size `B x D`
+        """
+        return self._forward_inputs(self._prepare_inputs(token_ids))
+
+    def _prepare_inputs_direct(self, texts):
+        """Have the fast tokenizer write the padded id and mask arrays in a single pass,
+        skipping the list-of-lists detour through :meth:`_tokenize` and the row-wise
+        buffer fill.
+
+        Applies only when the tokenizer is rust-backed and none of the strings is in the
+        token cache (otherwise the cached rows are reassembled the usual way); returns
+        ``None`` when the fast path does not apply.
+        """
+        if not getattr(self.tokenizer, 'is_fast', False) or any(t in self._tok_cache for t in texts):
+            return None
+        encoded = self.tokenizer(texts, padding=True, truncation=True,
+                                 max_length=self.max_length, return_tensors='np')
+        ids_buf = encoded['input_ids'].astype(np.int32, copy=False)
+        mask_buf = encoded['attention_mask'].astype(np.int32, copy=False)
+        seq_lens = mask_buf.sum(axis=1)
+        cache = self._tok_cache
+        for row, t in enumerate(texts):
+            cache[t] = ids_buf[row, :seq_lens[row]].copy()
+        while len(cache) > _TOK_CACHE_CAPACITY:
+            cache.popitem(last=False)
+        return self.array2tensor(ids_buf), self.array2tensor(mask_buf)
+
+    def _prepare_inputs(self, token_ids):
+        """Pad ``token_ids`` into contiguous id/mask buffers and move them to the device"""
+        seq_lens = np.array([len(t) for t in token_ids])
+        max_len = int(seq_lens.max())
+        # one contiguous int32 buffer instead of a list of python lists: a single
+        # allocation, a vectorized mask and half the transfer volume of int64
+        ids_buf = np.full((len(token_ids), max_len), self._pad_id or 0, dtype=np.int32)
+        for row, ids in enumerate(token_ids):
+            ids_buf[row, :len(ids)] = ids
+        mask_buf = (np.arange(max_len)[np.newaxis, :] < seq_lens[:, np.newaxis]).astype(np.int32)
+        return self.array2tensor(ids_buf), self.array2tensor(mask_buf)
+
+    def _forward_inputs(self, inputs) -> 'np.ndarray':
+        token_ids_batch, mask_ids_batch = inputs
+        with self._sess_func():
+            seq_output, *extra_output = self._run_model(token_ids_batch, mask_ids_batch)
+            if self._use_pooler_output:
+                output = self.tensor2array(extra_output[0])
+            else:
+                # pool down to B x D while still on the device, only the pooled
+                # result crosses back to the host
+                output = self._pool_fn(seq_output, mask_ids_batch)
+        return output
+
+    def __getstate__(self):
+        if not os.path.exists(self.model_abspath):
+            self.logger.info("create folder for saving transformer models: {}".format(self.model_abspath))
+            os.mkdir(self.model_abspath)
+        try:
+            # safetensors checkpoints load back via mmap instead of a full read + unpickle
+            self.model.save_pretrained(self.model_abspath, safe_serialization=True)
+        except TypeError:
+            self.model.save_pretrained(self.model_abspath)
+        self.tokenizer.save_pretrained(self.model_abspath)
+        return super().__getstate__()
+
+    @property
+    def model_abspath(self) -> str:
+        """Get the file path of the encoder model storage
+
+        """
+        return self.get_file_from_workspace(self.raw_model_path)
+
+    def post_init(self):
+        self._init_tokenizer()
+        self._init_model()
+        # resolve the per-batch constants once so encode does not pay the attribute
+        # lookups and the strategy if/elif ladder on every call
+        self._pad_id = self.tokenizer.pad_token_id
+        self._tok_cache = OrderedDict()
+        # one worker is enough, it only stages the next bucket's inputs while the
+        # device is busy with the current one; on CPU there is nothing to overlap with
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1) if self.on_gpu else None
+        self._use_pooler_output = (self.pooling_strategy == 'cls'
+                                   and self.model_name in ('bert-base-uncased', 'roberta-base'))
+        self._pool_fn = self._get_pool_fn()
+
+    def _get_pool_fn(self):
+        if self.pooling_strategy == 'cls':
+            return self._pool_cls
+        pool_fn_dict = {
+            'mean': self._pool_mean,
+            'max': self._pool_max,
+            'min': self._pool_min
+        }
+        if self.pooling_strategy not in pool_fn_dict:
+            self.logger.error('pooling strategy not found: {}'.format(self.pooling_strategy))
+            raise NotImplementedError
+        if not self.on_gpu:
+            # on cpu the sequence output is already host memory, so a fused single-pass
+            # numba kernel over the (zero-copy) numpy view beats the tensor ops
+            numba_fn = get_numba_pool_fn(self.pooling_strategy)
+            if numba_fn is not None:
+                return lambda seq_output, mask: numba_fn(self.tensor2array(seq_output), self.tensor2array(mask))
+        return pool_fn_dict[self.pooling_strategy]
+
+    def _pool_mean(self, seq_output, mask):
+        raise NotImplementedError
+
+    def _pool_max(self, seq_output, mask):
+        raise NotImplementedError
+
+    def _pool_min(self, seq_output, mask):
+        raise NotImplementedError
+
+    def _pool_cls(self, seq_output, mask):
+        raise NotImplementedError
+
+    def _init_model(self):
+        raise NotImplementedError
+
+    def _run_model(self, token_ids_batch, mask_ids_batch):
+        return self.model(token_ids_batch, attention_mask=mask_ids_batch)
+
+    def close(self):
+        if getattr(self, '_prefetch_pool', None) is not None:
+            self._prefetch_pool.shutdown()
+        super().close()
+
+    def array2tensor(self, array):
+        return self._tensor_func(array)
+
+    def tensor2array(self, tensor):
+        return tensor.numpy()
+
+
+class TransformerTFEncoder(BaseTFExecutor, BaseTransformerEncoder):
+    """
+    Internally, TransformerTFEncoder wraps the tensorflow-version of transformers from huggingface.
+    """
+
+    def _init_model(self):
+        self.to_device()
+        import tensorflow as tf
+        if self.quantize_model:
+            self.logger.warning('int8 quantization is not supported by the TF backend, ignoring it')
+        if self.on_gpu:
+            try:
+                tf.keras.mixed_precision.set_global_policy('mixed_float16')
+            except AttributeError:
+                tf.keras.mixed_precision.experimental.set_policy('mixed_float16')
+        self.model = _get_transformers_class(
+            _TF_MODEL_CLS[self.model_name]).from_pretrained(self._tmp_model_path)
+        self._tensor_func = tf.constant
+        # no gradients are ever needed here, so no tape: the forward is traced once into
+        # a graph instead. The dims stay symbolic so bucketed batches share the trace.
+        import contextlib
+        self._sess_func = contextlib.nullcontext
+        signature = [tf.TensorSpec(shape=(None, None), dtype=tf.int32)] * 2
+
+        def _fwd(token_ids_batch, mask_ids_batch):
+            return self.model(token_ids_batch, attention_mask=mask_ids_batch)
+
+        try:
+            self._traced_fwd = tf.function(_fwd, input_signature=signature, jit_compile=True)
+        except TypeError:
+            # older TF has no jit_compile kwarg, keep the plain (non-XLA) graph
+            self._traced_fwd = tf.function(_fwd, input_signature=signature)
+        if self.model_name in ('xlnet-base-cased', 'openai-gpt', 'gpt2', 'xlm-mlm-enfr-1024'):
+            vocab_size = len(self.tokenizer)
+            if self.model.config.vocab_size != vocab_size:
+                self.model.resize_token_embeddings(vocab_size)
+
+    def _run_model(self, token_ids_batch, mask_ids_batch):
+        return self._traced_fwd(token_ids_batch, mask_ids_batch)
+
+    def _pool_mean(self, seq_output, mask):
+        import tensorflow as tf
+        mask = tf.cast(mask, seq_output.dtype)[:, :, tf.newaxis]
+        output = tf.reduce_sum(seq_output * mask, axis=1) / tf.maximum(tf.reduce_sum(mask, axis=1), 1.)
+        return self.tensor2array(output)
+
+    def _pool_max(self, seq_output, mask):
+        import tensorflow as tf
+        mask = tf.cast(mask, tf.bool)[:, :, tf.newaxis]
+        output = tf.reduce_max(tf.where(mask, seq_output, seq_output.dtype.min), axis=1)
+        return self.tensor2array(output)
+
+    def _pool_min(self, seq_output, mask):
+        import tensorflow as tf
+        mask = tf.cast(mask, tf.bool)[:, :, tf.newaxis]
+        output = tf.reduce_min(tf.where(mask, seq_output, seq_output.dtype.max), axis=1)
+        return self.tensor2array(output)
+
+    def _pool_cls(self, seq_output, mask):
+        import tensorflow as tf
+        if self.cls_pos == 'tail':
+            idx = tf.reduce_sum(mask, axis=1) - 1
+            output = tf.gather(seq_output, idx, batch_dims=1)
+        else:
+            output = seq_output[:, 0]
+        return self.tensor2array(output)
+
+
+class TransformerTorchEncoder(BaseTorchExecutor, BaseTransformerEncoder):
+    """
+    Internally, TransformerTorchEncoder wraps the pytorch-version of transformers from huggingface.
+    """
+
+    def _init_model(self):
+        import torch
+        model_cls = _get_transformers_class(_TORCH_MODEL_CLS[self.model_name])
+        load_kwargs = {}
+        if self.on_gpu:
+            # half precision halves the bytes moved from HBM on every forward; bf16 keeps
+            # the fp32 dynamic range, fp16 is the fallback for pre-Ampere cards
+            half_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            load_kwargs['torch_dtype'] = half_dtype
+        if self.quantize_model and self.on_gpu:
+            try:
+                import bitsandbytes  # noqa: F401
+                from transformers import BitsAndBytesConfig
+                load_kwargs['quantization_config'] = BitsAndBytesConfig(load_in_8bit=True)
+            except ImportError:
+                self.logger.warning('bitsandbytes is not installed, skipping int8 quantization')
+        # prefer the fused attention backends, they avoid materializing the (B, H, S, S)
+        # score matrix; fall back on devices/versions where they are not available
+        attn_backends = ('flash_attention_2', 'sdpa', None) if self.on_gpu else ('sdpa', None)
+        for attn_impl in attn_backends:
+            _kwargs = dict(load_kwargs, attn_implementation=attn_impl) if attn_impl else load_kwargs
+            try:
+                self.model = model_cls.from_pretrained(self._tmp_model_path, **_kwargs)
+                break
+            except (ImportError, ValueError, TypeError):
+                self.logger.warning(f'attention backend "{attn_impl}" is not available, trying the next one')
+        self._tensor_func = torch.tensor
+        inference_ctx = getattr(torch, 'inference_mode', torch.no_grad)
+        if self.on_gpu:
+            import contextlib
+
+            @contextlib.contextmanager
+            def _inference_autocast():
+                with inference_ctx(), torch.autocast('cuda', dtype=half_dtype):
+                    yield
+
+            self._sess_func = _inference_autocast
+        else:
+            self._sess_func = inference_ctx
+        if self.model_name in ('xlnet-base-cased', 'openai-gpt', 'gpt2', 'xlm-mlm-enfr-1024'):
+            # resizing reallocates and copies the whole V x H embedding matrix,
+            # skip it when the tokenizer vocab already matches
+            vocab_size = len(self.tokenizer)
+            if self.model.get_input_embeddings().num_embeddings != vocab_size:
+                self.model.resize_token_embeddings(vocab_size)
+        if self.quantize_model and not self.on_gpu:
+            # dynamic quantization packs the linear weights to int8 and keeps the
+            # activations in fp32, so no calibration pass is needed
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        self.to_device(self.model)
+        if hasattr(torch, 'compile'):
+            try:
+                # padding is dynamic so the sequence dim varies between batches; let the
+                # compiler keep it symbolic instead of recompiling per shape
+                self.model = torch.compile(self.model, mode='reduce-overhead', dynamic=True)
+            except Exception:
+                self.logger.warning('torch.compile failed, falling back to the eager model')
+        # four slots: the ids and mask of the in-flight bucket plus the ones being
+        # prefetched for the next bucket must never alias
+        self._pinned_bufs = [None] * 4
+        self._pin_slot = 0
+
+    def _pool_mean(self, seq_output, mask):
+        mask = mask.unsqueeze(-1).to(seq_output.dtype)
+        output = (seq_output * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        return self.tensor2array(output)
+
+    def _pool_max(self, seq_output, mask):
+        output = seq_output.masked_fill((mask == 0).unsqueeze(-1), float('-inf')).max(dim=1).values
+        return self.tensor2array(output)
+
+    def _pool_min(self, seq_output, mask):
+        output = seq_output.masked_fill((mask == 0).unsqueeze(-1), float('inf')).min(dim=1).values
+        return self.tensor2array(output)
+
+    def _pool_cls(self, seq_output, mask):
+        import torch
+        if self.cls_pos == 'tail':
+            idx = mask.sum(dim=1) - 1
+            output = seq_output[torch.arange(seq_output.shape[0], device=seq_output.device), idx]
+        else:
+            output = seq_output[:, 0]
+        return self.tensor2array(output)
+
+    def array2tensor(self, array):
+        import torch
+        if isinstance(array, np.ndarray):
+            # unlike torch.tensor, from_numpy shares the buffer instead of copying it
+            tensor = torch.from_numpy(np.ascontiguousarray(array))
+        else:
+            tensor = super().array2tensor(array)
+        if self.on_gpu:
+            # staging the host tensor in pinned memory lets the PCIe transfer run as DMA
+            # and the non-blocking copy overlap with the kernels already queued
+            tensor = self._pinned_copy(tensor).to(self.device, non_blocking=True)
+        if tensor.dtype == torch.int32:
+            # the embedding lookup expects int64 indices, widen only after the copy
+            tensor = tensor.long()
+        return tensor
+
+    def _pinned_copy(self, tensor):
+        import torch
+        # the slots are cycled so the ids and the mask of one batch never share a buffer
+        # while their copies may still be in flight
+        slot = self._pin_slot
+        self._pin_slot = (slot + 1) % len(self._pinned_bufs)
+        buf = self._pinned_bufs[slot]
+        if buf is None or buf.dtype != tensor.dtype or buf.numel() < tensor.numel():
+            buf = torch.empty(tensor.numel(), dtype=tensor.dtype, pin_memory=True)
+            self._pinned_bufs[slot] = buf
+        pinned = buf[:tensor.numel()].view(tensor.shape)
+        pinned.copy_(tensor)
+        return pinned
+
+    def tensor2array(self, tensor):
+        import torch
+        # a no-op under inference_mode, but keeps autograd state out of the copy otherwise
+        tensor = tensor.detach()
+        if self.on_gpu:
+            # drain the queued non-blocking copies and kernels before reading back
+            torch.cuda.synchronize()
+            tensor = tensor.cpu()
+        if tensor.dtype in (torch.float16, torch.bfloat16):
+            # downstream consumers expect fp32; bf16 has no numpy counterpart anyway
+            tensor = tensor.float()
+        return tensor.numpy()
@@ -0,0 +1,1392 @@
+__copyright__ = "Copyright (c) 2020 Jina AI Limited. All rights reserved."
+__license__ = "Apache-2.0"
+
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: jina.proto
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='jina.proto',
+  package='jina',
+  syntax='proto3',
+  serialized_options=None,
+  serialized_pb=b'\n\njina.proto\x12\x04jina\x1a\x1fgoogle/protobuf/timestamp.proto\"\xec\x01\n\x07NdArray\x12\x11\n\traw_bytes\x18\x01 \x01(\x0c\x12\r\n\x05shape\x18\x02 \x03(\r\x12\r\n\x05\x64type\x18\x03 \x01(\t\x12\x34\n\x0cquantization\x18\x04 \x01(\x0e\x32\x1e.jina.NdArray.QuantizationMode\x12\x0f\n\x07max_val\x18\x05 \x01(\x02\x12\x0f\n\x07min_val\x18\x06 \x01(\x02\x12\r\n\x05scale\x18\x07 \x01(\x02\x12\x16\n\x0eoriginal_dtype\x18\x08 \x01(\t\"1\n\x10QuantizationMode\x12\x08\n\x04NONE\x10\x00\x12\x08\n\x04\x46P16\x10\x01\x12\t\n\x05UINT8\x10\x02\"\xf2\x01\n\x0cScoredResult\x12\"\n\x0bmatch_chunk\x18\x01 \x01(\x0b\x32\x0b.jina.ChunkH\x00\x12#\n\tmatch_doc\x18\x02 \x01(\x0b\x32\x0e.jina.DocumentH\x00\x12\'\n\x05score\x18\x03 \x01(\x0b\x32\x18.jina.ScoredResult.Score\x1ah\n\x05Score\x12\r\n\x05value\x18\x01 \x01(\x02\x12\x0f\n\x07op_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12*\n\x08operands\x18\x04 \x03(\x0b\x32\x18.jina.ScoredResult.ScoreB\x06\n\x04\x62ody\"\x87\x02\n\x05\x43hunk\x12\x0e\n\x06\x64oc_id\x18\x01 \x01(\r\x12\x10\n\x08\x63hunk_id\x18\x02 \x01(\r\x12\x0e\n\x04text\x18\x03 \x01(\tH\x00\x12\x1d\n\x04\x62lob\x18\x04 \x01(\x0b\x32\r.jina.NdArrayH\x00\x12\x13\n\traw_bytes\x18\x05 \x01(\x0cH\x00\x12 \n\tembedding\x18\x06 \x01(\x0b\x32\r.jina.NdArray\x12\x0e\n\x06offset\x18\x07 \x01(\r\x12\x0e\n\x06weight\x18\x08 \x01(\x02\x12\x0e\n\x06length\x18\t \x01(\r\x12\x11\n\tmeta_info\x18\n \x01(\x0c\x12(\n\x0ctopk_results\x18\x0b \x03(\x0b\x32\x12.jina.ScoredResultB\t\n\x07\x63ontent\"\xa7\x01\n\x08\x44ocument\x12\x0e\n\x06\x64oc_id\x18\x01 \x01(\r\x12\x11\n\traw_bytes\x18\x03 \x01(\x0c\x12\x1b\n\x06\x63hunks\x18\x04 \x03(\x0b\x32\x0b.jina.Chunk\x12\x0e\n\x06weight\x18\x05 \x01(\x02\x12\x0e\n\x06length\x18\x06 \x01(\r\x12\x11\n\tmeta_info\x18\x07 \x01(\x0c\x12(\n\x0ctopk_results\x18\x08 \x03(\x0b\x32\x12.jina.ScoredResult\"\xc1\x03\n\x08\x45nvelope\x12\x11\n\tsender_id\x18\x01 \x01(\t\x12\x13\n\x0breceiver_id\x18\x02 \x01(\t\x12\x12\n\nrequest_id\x18\x03 \x01(\r\x12\x0f\n\x07timeout\x18\x04 \x01(\r\x12$\n\x06routes\x18\x05 \x03(\x0b\x32\x14.jina.Envelope.Route\x12\'\n\x07version\x18\x06 \x01(\x0b\x32\x16.jina.Envelope.Version\x12%\n\x06status\x18\x07 \x01(\x0e\x32\x15.jina.Envelope.Status\x1a\x82\x01\n\x05Route\x12\x0b\n\x03pod\x18\x01 \x01(\t\x12\x0e\n\x06pod_id\x18\x02 \x01(\t\x12.\n\nstart_time\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x33\n\x07Version\x12\x0c\n\x04jina\x18\x01 \x01(\t\x12\r\n\x05proto\x18\x02 \x01(\t\x12\x0b\n\x03vcs\x18\x03 \x01(\t\"8\n\x06Status\x12\x0b\n\x07SUCCESS\x10\x00\x12\t\n\x05\x45RROR\x10\x01\x12\x0b\n\x07PENDING\x10\x02\x12\t\n\x05READY\x10\x03\"K\n\x07Message\x12 \n\x08\x65nvelope\x18\x01 \x01(\x0b\x32\x0e.jina.Envelope\x12\x1e\n\x07request\x18\x02 \x01(\x0b\x32\r.jina.Request\"\xf1\x04\n\x07Request\x12\x12\n\nrequest_id\x18\x01 \x01(\r\x12+\n\x05train\x18\x02 \x01(\x0b\x32\x1a.jina.Request.TrainRequestH\x00\x12+\n\x05index\x18\x03 \x01(\x0b\x32\x1a.jina.Request.IndexRequestH\x00\x12-\n\x06search\x18\x04 \x01(\x0b\x32\x1b.jina.Request.SearchRequestH\x00\x12/\n\x07\x63ontrol\x18\x05 \x01(\x0b\x32\x1c.jina.Request.ControlRequestH\x00\x1a;\n\x0cTrainRequest\x12\x1c\n\x04\x64ocs\x18\x01 \x03(\x0b\x32\x0e.jina.Document\x12\r\n\x05\x66lush\x18\x02 \x01(\x08\x1a,\n\x0cIndexRequest\x12\x1c\n\x04\x64ocs\x18\x01 \x03(\x0b\x32\x0e.jina.Document\x1a<\n\rSearchRequest\x12\x1c\n\x04\x64ocs\x18\x01 \x03(\x0b\x32\x0e.jina.Document\x12\r\n\x05top_k\x18\x02 \x01(\r\x1a\xe6\x01\n\x0e\x43ontrolRequest\x12\x35\n\x07\x63ommand\x18\x01 \x01(\x0e\x32$.jina.Request.ControlRequest.Command\x12\x34\n\x04\x61rgs\x18\x02 \x03(\x0b\x32&.jina.Request.ControlRequest.ArgsEntry\x1a+\n\tArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\":\n\x07\x43ommand\x12\r\n\tTERMINATE\x10\x00\x12\n\n\x06STATUS\x10\x01\x12\n\n\x06\x44RYRUN\x10\x02\x12\x08\n\x04IDLE\x10\x03\x42\x06\n\x04\x62ody\"\xc3\x04\n\x0cSpawnRequest\x12\x31\n\x03pea\x18\x01 \x01(\x0b\x32\".jina.SpawnRequest.PeaSpawnRequestH\x00\x12\x31\n\x03pod\x18\x02 \x01(\x0b\x32\".jina.SpawnRequest.PodSpawnRequestH\x00\x12@\n\x0bmutable_pod\x18\x03 \x01(\x0b\x32).jina.SpawnRequest.MutablepodSpawnRequestH\x00\x12\x12\n\nlog_record\x18\x04 \x01(\t\x12)\n\x06status\x18\x05 \x01(\x0e\x32\x19.jina.SpawnRequest.Status\x1a\x1f\n\x0fPeaSpawnRequest\x12\x0c\n\x04\x61rgs\x18\x01 \x03(\t\x1a\x1f\n\x0fPodSpawnRequest\x12\x0c\n\x04\x61rgs\x18\x01 \x03(\t\x1a\xae\x01\n\x16MutablepodSpawnRequest\x12\x30\n\x04head\x18\x01 \x01(\x0b\x32\".jina.SpawnRequest.PeaSpawnRequest\x12\x30\n\x04tail\x18\x02 \x01(\x0b\x32\".jina.SpawnRequest.PeaSpawnRequest\x12\x30\n\x04peas\x18\x03 \x03(\x0b\x32\".jina.SpawnRequest.PeaSpawnRequest\"Q\n\x06Status\x12\x0b\n\x07SUCCESS\x10\x00\x12\x0f\n\x0b\x45RROR_OTHER\x10\x01\x12\x13\n\x0f\x45RROR_DUPLICATE\x10\x02\x12\x14\n\x10\x45RROR_NOTALLOWED\x10\x03\x42\x06\n\x04\x62ody2j\n\x07JinaRPC\x12*\n\x04\x43\x61ll\x12\r.jina.Request\x1a\r.jina.Request\"\x00(\x01\x30\x01\x12\x33\n\x05Spawn\x12\x12.jina.SpawnRequest\x1a\x12.jina.SpawnRequest\"\x00\x30\x01\x62\x06proto3'
+  ,
+  dependencies=[google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,])
+
+
+
+_NDARRAY_QUANTIZATIONMODE = _descriptor.EnumDescriptor(
+  name='QuantizationMode',
+  full_name='jina.NdArray.QuantizationMode',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='NONE', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FP16', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UINT8', index=2, number=2,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=241,
+  serialized_end=290,
+)
+_sym_db.RegisterEnumDescriptor(_NDARRAY_QUANTIZATIONMODE)
+
+_ENVELOPE_STATUS = _descriptor.EnumDescriptor(
+  name='Status',
+  full_name='jina.Envelope.Status',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='SUCCESS', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PENDING', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='READY', index=3, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1367,
+  serialized_end=1423,
+)
+_sym_db.RegisterEnumDescriptor(_ENVELOPE_STATUS)
+
+_REQUEST_CONTROLREQUEST_COMMAND = _descriptor.EnumDescriptor(
+  name='Command',
+  full_name='jina.Request.ControlRequest.Command',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='TERMINATE', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='STATUS', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRYRUN', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='IDLE', index=3, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2062,
+  serialized_end=2120,
+)
+_sym_db.RegisterEnumDescriptor(_REQUEST_CONTROLREQUEST_COMMAND)
+
+_SPAWNREQUEST_STATUS = _descriptor.EnumDescriptor(
+  name='Status',
+  full_name='jina.SpawnRequest.Status',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='SUCCESS', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR_OTHER', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR_DUPLICATE', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR_NOTALLOWED', index=3, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2621,
+  serialized_end=2702,
+)
+_sym_db.RegisterEnumDescriptor(_SPAWNREQUEST_STATUS)
+
+
+_NDARRAY = _descriptor.Descriptor(
+  name='NdArray',
+  full_name='jina.NdArray',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='raw_bytes', full_name='jina.NdArray.raw_bytes', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='shape', full_name='jina.NdArray.shape', index=1,
+      number=2, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dtype', full_name='jina.NdArray.dtype', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='quantization', full_name='jina.NdArray.quantization', index=3,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_val', full_name='jina.NdArray.max_val', index=4,
+      number=5, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='min_val', full_name='jina.NdArray.min_val', index=5,
+      number=6, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='scale', full_name='jina.NdArray.scale', index=6,
+      number=7, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='original_dtype', full_name='jina.NdArray.original_dtype', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _NDARRAY_QUANTIZATIONMODE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=54,
+  serialized_end=290,
+)
+
+
+_SCOREDRESULT_SCORE = _descriptor.Descriptor(
+  name='Score',
+  full_name='jina.ScoredResult.Score',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='value', full_name='jina.ScoredResult.Score.value', index=0,
+      number=1, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='op_name', full_name='jina.ScoredResult.Score.op_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='jina.ScoredResult.Score.description', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='operands', full_name='jina.ScoredResult.Score.operands', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=423,
+  serialized_end=527,
+)
+
+_SCOREDRESULT = _descriptor.Descriptor(
+  name='ScoredResult',
+  full_name='jina.ScoredResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='match_chunk', full_name='jina.ScoredResult.match_chunk', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='match_doc', full_name='jina.ScoredResult.match_doc', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='score', full_name='jina.ScoredResult.score', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SCOREDRESULT_SCORE, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='body', full_name='jina.ScoredResult.body',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=293,
+  serialized_end=535,
+)
+
+
+_CHUNK = _descriptor.Descriptor(
+  name='Chunk',
+  full_name='jina.Chunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='doc_id', full_name='jina.Chunk.doc_id', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='chunk_id', full_name='jina.Chunk.chunk_id', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='text', full_name='jina.Chunk.text', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='blob', full_name='jina.Chunk.blob', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_bytes', full_name='jina.Chunk.raw_bytes', index=4,
+      number=5, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='embedding', full_name='jina.Chunk.embedding', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='jina.Chunk.offset', index=6,
+      number=7, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='weight', full_name='jina.Chunk.weight', index=7,
+      number=8, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='jina.Chunk.length', index=8,
+      number=9, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='meta_info', full_name='jina.Chunk.meta_info', index=9,
+      number=10, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='topk_results', full_name='jina.Chunk.topk_results', index=10,
+      number=11, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='content', full_name='jina.Chunk.content',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=538,
+  serialized_end=801,
+)
+
+
+_DOCUMENT = _descriptor.Descriptor(
+  name='Document',
+  full_name='jina.Document',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='doc_id', full_name='jina.Document.doc_id', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='raw_bytes', full_name='jina.Document.raw_bytes', index=1,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='chunks', full_name='jina.Document.chunks', index=2,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='weight', full_name='jina.Document.weight', index=3,
+      number=5, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='length', full_name='jina.Document.length', index=4,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='meta_info', full_name='jina.Document.meta_info', index=5,
+      number=7, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='topk_results', full_name='jina.Document.topk_results', index=6,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=804,
+  serialized_end=971,
+)
+
+
+_ENVELOPE_ROUTE = _descriptor.Descriptor(
+  name='Route',
+  full_name='jina.Envelope.Route',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pod', full_name='jina.Envelope.Route.pod', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pod_id', full_name='jina.Envelope.Route.pod_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start_time', full_name='jina.Envelope.Route.start_time', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='end_time', full_name='jina.Envelope.Route.end_time', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1182,
+  serialized_end=1312,
+)
+
+_ENVELOPE_VERSION = _descriptor.Descriptor(
+  name='Version',
+  full_name='jina.Envelope.Version',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='jina', full_name='jina.Envelope.Version.jina', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='proto', full_name='jina.Envelope.Version.proto', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='vcs', full_name='jina.Envelope.Version.vcs', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1314,
+  serialized_end=1365,
+)
+
+_ENVELOPE = _descriptor.Descriptor(
+  name='Envelope',
+  full_name='jina.Envelope',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sender_id', full_name='jina.Envelope.sender_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='receiver_id', full_name='jina.Envelope.receiver_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='request_id', full_name='jina.Envelope.request_id', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timeout', full_name='jina.Envelope.timeout', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='routes', full_name='jina.Envelope.routes', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='jina.Envelope.version', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='jina.Envelope.status', index=6,
+      number=7, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_ENVELOPE_ROUTE, _ENVELOPE_VERSION, ],
+  enum_types=[
+    _ENVELOPE_STATUS,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=974,
+  serialized_end=1423,
+)
+
+
+_MESSAGE = _descriptor.Descriptor(
+  name='Message',
+  full_name='jina.Message',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='envelope', full_name='jina.Message.envelope', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='request', full_name='jina.Message.request', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1425,
+  serialized_end=1500,
+)
+
+
+_REQUEST_TRAINREQUEST = _descriptor.Descriptor(
+  name='TrainRequest',
+  full_name='jina.Request.TrainRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='jina.Request.TrainRequest.docs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flush', full_name='jina.Request.TrainRequest.flush', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1720,
+  serialized_end=1779,
+)
+
+_REQUEST_INDEXREQUEST = _descriptor.Descriptor(
+  name='IndexRequest',
+  full_name='jina.Request.IndexRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='jina.Request.IndexRequest.docs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1781,
+  serialized_end=1825,
+)
+
+_REQUEST_SEARCHREQUEST = _descriptor.Descriptor(
+  name='SearchRequest',
+  full_name='jina.Request.SearchRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='docs', full_name='jina.Request.SearchRequest.docs', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='top_k', full_name='jina.Request.SearchRequest.top_k', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1827,
+  serialized_end=1887,
+)
+
+_REQUEST_CONTROLREQUEST_ARGSENTRY = _descriptor.Descriptor(
+  name='ArgsEntry',
+  full_name='jina.Request.ControlRequest.ArgsEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='jina.Request.ControlRequest.ArgsEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='jina.Request.ControlRequest.ArgsEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2017,
+  serialized_end=2060,
+)
+
+_REQUEST_CONTROLREQUEST = _descriptor.Descriptor(
+  name='ControlRequest',
+  full_name='jina.Request.ControlRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='command', full_name='jina.Request.ControlRequest.command', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='args', full_name='jina.Request.ControlRequest.args', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_REQUEST_CONTROLREQUEST_ARGSENTRY, ],
+  enum_types=[
+    _REQUEST_CONTROLREQUEST_COMMAND,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1890,
+  serialized_end=2120,
+)
+
+_REQUEST = _descriptor.Descriptor(
+  name='Request',
+  full_name='jina.Request',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='request_id', full_name='jina.Request.request_id', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='train', full_name='jina.Request.train', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='index', full_name='jina.Request.index', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='search', full_name='jina.Request.search', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='control', full_name='jina.Request.control', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_REQUEST_TRAINREQUEST, _REQUEST_INDEXREQUEST, _REQUEST_SEARCHREQUEST, _REQUEST_CONTROLREQUEST, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='body', full_name='jina.Request.body',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=1503,
+  serialized_end=2128,
+)
+
+
+_SPAWNREQUEST_PEASPAWNREQUEST = _descriptor.Descriptor(
+  name='PeaSpawnRequest',
+  full_name='jina.SpawnRequest.PeaSpawnRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='args', full_name='jina.SpawnRequest.PeaSpawnRequest.args', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2378,
+  serialized_end=2409,
+)
+
+_SPAWNREQUEST_PODSPAWNREQUEST = _descriptor.Descriptor(
+  name='PodSpawnRequest',
+  full_name='jina.SpawnRequest.PodSpawnRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='args', full_name='jina.SpawnRequest.PodSpawnRequest.args', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2411,
+  serialized_end=2442,
+)
+
+_SPAWNREQUEST_MUTABLEPODSPAWNREQUEST = _descriptor.Descriptor(
+  name='MutablepodSpawnRequest',
+  full_name='jina.SpawnRequest.MutablepodSpawnRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='head', full_name='jina.SpawnRequest.MutablepodSpawnRequest.head', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='tail', full_name='jina.SpawnRequest.MutablepodSpawnRequest.tail', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='peas', full_name='jina.SpawnRequest.MutablepodSpawnRequest.peas', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2445,
+  serialized_end=2619,
+)
+
+_SPAWNREQUEST = _descriptor.Descriptor(
+  name='SpawnRequest',
+  full_name='jina.SpawnRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pea', full_name='jina.SpawnRequest.pea', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pod', full_name='jina.SpawnRequest.pod', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mutable_pod', full_name='jina.SpawnRequest.mutable_pod', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='log_record', full_name='jina.SpawnRequest.log_record', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='jina.SpawnRequest.status', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[_SPAWNREQUEST_PEASPAWNREQUEST, _SPAWNREQUEST_PODSPAWNREQUEST, _SPAWNREQUEST_MUTABLEPODSPAWNREQUEST, ],
+  enum_types=[
+    _SPAWNREQUEST_STATUS,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='body', full_name='jina.SpawnRequest.body',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=2131,
+  serialized_end=2710,
+)
+
+_NDARRAY.fields_by_name['quantization'].enum_type = _NDARRAY_QUANTIZATIONMODE
+_NDARRAY_QUANTIZATIONMODE.containing_type = _NDARRAY
+_SCOREDRESULT_SCORE.fields_by_name['operands'].message_type = _SCOREDRESULT_SCORE
+_SCOREDRESULT_SCORE.containing_type = _SCOREDRESULT
+_SCOREDRESULT.fields_by_name['match_chunk'].message_type = _CHUNK
+_SCOREDRESULT.fields_by_name['match_doc'].message_type = _DOCUMENT
+_SCOREDRESULT.fields_by_name['score'].message_type = _SCOREDRESULT_SCORE
+_SCOREDRESULT.oneofs_by_name['body'].fields.append(
+  _SCOREDRESULT.fields_by_name['match_chunk'])
+_SCOREDRESULT.fields_by_name['match_chunk'].containing_oneof = _SCOREDRESULT.oneofs_by_name['body']
+_SCOREDRESULT.oneofs_by_name['body'].fields.append(
+  _SCOREDRESULT.fields_by_name['match_doc'])
+_SCOREDRESULT.fields_by_name['match_doc'].containing_oneof = _SCOREDRESULT.oneofs_by_name['body']
+_CHUNK.fields_by_name['blob'].message_type = _NDARRAY
+_CHUNK.fields_by_name['embedding'].message_type = _NDARRAY
+_CHUNK.fields_by_name['topk_results'].message_type = _SCOREDRESULT
+_CHUNK.oneofs_by_name['content'].fields.append(
+  _CHUNK.fields_by_name['text'])
+_CHUNK.fields_by_name['text'].containing_oneof = _CHUNK.oneofs_by_name['content']
+_CHUNK.oneofs_by_name['content'].fields.append(
+  _CHUNK.fields_by_name['blob'])
+_CHUNK.fields_by_name['blob'].containing_oneof = _CHUNK.oneofs_by_name['content']
+_CHUNK.oneofs_by_name['content'].fields.append(
+  _CHUNK.fields_by_name['raw_bytes'])
+_CHUNK.fields_by_name['raw_bytes'].containing_oneof = _CHUNK.oneofs_by_name['content']
+_DOCUMENT.fields_by_name['chunks'].message_type = _CHUNK
+_DOCUMENT.fields_by_name['topk_results'].message_type = _SCOREDRESULT
+_ENVELOPE_ROUTE.fields_by_name['start_time'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_ENVELOPE_ROUTE.fields_by_name['end_time'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
+_ENVELOPE_ROUTE.containing_type = _ENVELOPE
+_ENVELOPE_VERSION.containing_type = _ENVELOPE
+_ENVELOPE.fields_by_name['routes'].message_type = _ENVELOPE_ROUTE
+_ENVELOPE.fields_by_name['version'].message_type = _ENVELOPE_VERSION
+_ENVELOPE.fields_by_name['status'].enum_type = _ENVELOPE_STATUS
+_ENVELOPE_STATUS.containing_type = _ENVELOPE
+_MESSAGE.fields_by_name['envelope'].message_type = _ENVELOPE
+_MESSAGE.fields_by_name['request'].message_type = _REQUEST
+_REQUEST_TRAINREQUEST.fields_by_name['docs'].message_type = _DOCUMENT
+_REQUEST_TRAINREQUEST.containing_type = _REQUEST
+_REQUEST_INDEXREQUEST.fields_by_name['docs'].message_type = _DOCUMENT
+_REQUEST_INDEXREQUEST.containing_type = _REQUEST
+_REQUEST_SEARCHREQUEST.fields_by_name['docs'].message_type = _DOCUMENT
+_REQUEST_SEARCHREQUEST.containing_type = _REQUEST
+_REQUEST_CONTROLREQUEST_ARGSENTRY.containing_type = _REQUEST_CONTROLREQUEST
+_REQUEST_CONTROLREQUEST.fields_by_name['command'].enum_type = _REQUEST_CONTROLREQUEST_COMMAND
+_REQUEST_CONTROLREQUEST.fields_by_name['args'].message_type = _REQUEST_CONTROLREQUEST_ARGSENTRY
+_REQUEST_CONTROLREQUEST.containing_type = _REQUEST
+_REQUEST_CONTROLREQUEST_COMMAND.containing_type = _REQUEST_CONTROLREQUEST
+_REQUEST.fields_by_name['train'].message_type = _REQUEST_TRAINREQUEST
+_REQUEST.fields_by_name['index'].message_type = _REQUEST_INDEXREQUEST
+_REQUEST.fields_by_name['search'].message_type = _REQUEST_SEARCHREQUEST
+_REQUEST.fields_by_name['control'].message_type = _REQUEST_CONTROLREQUEST
+_REQUEST.oneofs_by_name['body'].fields.append(
+  _REQUEST.fields_by_name['train'])
+_REQUEST.fields_by_name['train'].containing_oneof = _REQUEST.oneofs_by_name['body']
+_REQUEST.oneofs_by_name['body'].fields.append(
+  _REQUEST.fields_by_name['index'])
+_REQUEST.fields_by_name['index'].containing_oneof = _REQUEST.oneofs_by_name['body']
+_REQUEST.oneofs_by_name['body'].fields.append(
+  _REQUEST.fields_by_name['search'])
+_REQUEST.fields_by_name['search'].containing_oneof = _REQUEST.oneofs_by_name['body']
+_REQUEST.oneofs_by_name['body'].fields.append(
+  _REQUEST.fields_by_name['control'])
+_REQUEST.fields_by_name['control'].containing_oneof = _REQUEST.oneofs_by_name['body']
+_SPAWNREQUEST_PEASPAWNREQUEST.containing_type = _SPAWNREQUEST
+_SPAWNREQUEST_PODSPAWNREQUEST.containing_type = _SPAWNREQUEST
+_SPAWNREQUEST_MUTABLEPODSPAWNREQUEST.fields_by_name['head'].message_type = _SPAWNREQUEST_PEASPAWNREQUEST
+_SPAWNREQUEST_MUTABLEPODSPAWNREQUEST.fields_by_name['tail'].message_type = _SPAWNREQUEST_PEASPAWNREQUEST
+_SPAWNREQUEST_MUTABLEPODSPAWNREQUEST.fields_by_name['peas'].message_type = _SPAWNREQUEST_PEASPAWNREQUEST
+_SPAWNREQUEST_MUTABLEPODSPAWNREQUEST.containing_type = _SPAWNREQUEST
+_SPAWNREQUEST.fields_by_name['pea'].message_type = _SPAWNREQUEST_PEASPAWNREQUEST
+_SPAWNREQUEST.fields_by_name['pod'].message_type = _SPAWNREQUEST_PODSPAWNREQUEST
+_SPAWNREQUEST.fields_by_name['mutable_pod'].message_type = _SPAWNREQUEST_MUTABLEPODSPAWNREQUEST
+_SPAWNREQUEST.fields_by_name['status'].enum_type = _SPAWNREQUEST_STATUS
+_SPAWNREQUEST_STATUS.containing_type = _SPAWNREQUEST
+_SPAWNREQUEST.oneofs_by_name['body'].fields.append(
+  _SPAWNREQUEST.fields_by_name['pea'])
+_SPAWNREQUEST.fields_by_name['pea'].containing_oneof = _SPAWNREQUEST.oneofs_by_name['body']
+_SPAWNREQUEST.oneofs_by_name['body'].fields.append(
+  _SPAWNREQUEST.fields_by_name['pod'])
+_SPAWNREQUEST.fields_by_name['pod'].containing_oneof = _SPAWNREQUEST.oneofs_by_name['body']
+_SPAWNREQUEST.oneofs_by_name['body'].fields.append(
+  _SPAWNREQUEST.fields_by_name['mutable_pod'])
+_SPAWNREQUEST.fields_by_name['mutable_pod'].containing_oneof = _SPAWNREQUEST.oneofs_by_name['body']
+DESCRIPTOR.message_types_by_name['NdArray'] = _NDARRAY
+DESCRIPTOR.message_types_by_name['ScoredResult'] = _SCOREDRESULT
+DESCRIPTOR.message_types_by_name['Chunk'] = _CHUNK
+DESCRIPTOR.message_types_by_name['Document'] = _DOCUMENT
+DESCRIPTOR.message_types_by_name['Envelope'] = _ENVELOPE
+DESCRIPTOR.message_types_by_name['Message'] = _MESSAGE
+DESCRIPTOR.message_types_by_name['Request'] = _REQUEST
+DESCRIPTOR.message_types_by_name['SpawnRequest'] = _SPAWNREQUEST
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+NdArray = _reflection.GeneratedProtocolMessageType('NdArray', (_message.Message,), {
+  'DESCRIPTOR' : _NDARRAY,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.NdArray)
+  })
+_sym_db.RegisterMessage(NdArray)
+
+ScoredResult = _reflection.GeneratedProtocolMessageType('ScoredResult', (_message.Message,), {
+
+  'Score' : _reflection.GeneratedProtocolMessageType('Score', (_message.Message,), {
+    'DESCRIPTOR' : _SCOREDRESULT_SCORE,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.ScoredResult.Score)
+    })
+  ,
+  'DESCRIPTOR' : _SCOREDRESULT,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.ScoredResult)
+  })
+_sym_db.RegisterMessage(ScoredResult)
+_sym_db.RegisterMessage(ScoredResult.Score)
+
+Chunk = _reflection.GeneratedProtocolMessageType('Chunk', (_message.Message,), {
+  'DESCRIPTOR' : _CHUNK,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.Chunk)
+  })
+_sym_db.RegisterMessage(Chunk)
+
+Document = _reflection.GeneratedProtocolMessageType('Document', (_message.Message,), {
+  'DESCRIPTOR' : _DOCUMENT,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.Document)
+  })
+_sym_db.RegisterMessage(Document)
+
+Envelope = _reflection.GeneratedProtocolMessageType('Envelope', (_message.Message,), {
+
+  'Route' : _reflection.GeneratedProtocolMessageType('Route', (_message.Message,), {
+    'DESCRIPTOR' : _ENVELOPE_ROUTE,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.Envelope.Route)
+    })
+  ,
+
+  'Version' : _reflection.GeneratedProtocolMessageType('Version', (_message.Message,), {
+    'DESCRIPTOR' : _ENVELOPE_VERSION,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.Envelope.Version)
+    })
+  ,
+  'DESCRIPTOR' : _ENVELOPE,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.Envelope)
+  })
+_sym_db.RegisterMessage(Envelope)
+_sym_db.RegisterMessage(Envelope.Route)
+_sym_db.RegisterMessage(Envelope.Version)
+
+Message = _reflection.GeneratedProtocolMessageType('Message', (_message.Message,), {
+  'DESCRIPTOR' : _MESSAGE,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.Message)
+  })
+_sym_db.RegisterMessage(Message)
+
+Request = _reflection.GeneratedProtocolMessageType('Request', (_message.Message,), {
+
+  'TrainRequest' : _reflection.GeneratedProtocolMessageType('TrainRequest', (_message.Message,), {
+    'DESCRIPTOR' : _REQUEST_TRAINREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.Request.TrainRequest)
+    })
+  ,
+
+  'IndexRequest' : _reflection.GeneratedProtocolMessageType('IndexRequest', (_message.Message,), {
+    'DESCRIPTOR' : _REQUEST_INDEXREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.Request.IndexRequest)
+    })
+  ,
+
+  'SearchRequest' : _reflection.GeneratedProtocolMessageType('SearchRequest', (_message.Message,), {
+    'DESCRIPTOR' : _REQUEST_SEARCHREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.Request.SearchRequest)
+    })
+  ,
+
+  'ControlRequest' : _reflection.GeneratedProtocolMessageType('ControlRequest', (_message.Message,), {
+
+    'ArgsEntry' : _reflection.GeneratedProtocolMessageType('ArgsEntry', (_message.Message,), {
+      'DESCRIPTOR' : _REQUEST_CONTROLREQUEST_ARGSENTRY,
+      '__module__' : 'jina_pb2'
+      # @@protoc_insertion_point(class_scope:jina.Request.ControlRequest.ArgsEntry)
+      })
+    ,
+    'DESCRIPTOR' : _REQUEST_CONTROLREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.Request.ControlRequest)
+    })
+  ,
+  'DESCRIPTOR' : _REQUEST,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.Request)
+  })
+_sym_db.RegisterMessage(Request)
+_sym_db.RegisterMessage(Request.TrainRequest)
+_sym_db.RegisterMessage(Request.IndexRequest)
+_sym_db.RegisterMessage(Request.SearchRequest)
+_sym_db.RegisterMessage(Request.ControlRequest)
+_sym_db.RegisterMessage(Request.ControlRequest.ArgsEntry)
+
+SpawnRequest = _reflection.GeneratedProtocolMessageType('SpawnRequest', (_message.Message,), {
+
+  'PeaSpawnRequest' : _reflection.GeneratedProtocolMessageType('PeaSpawnRequest', (_message.Message,), {
+    'DESCRIPTOR' : _SPAWNREQUEST_PEASPAWNREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.SpawnRequest.PeaSpawnRequest)
+    })
+  ,
+
+  'PodSpawnRequest' : _reflection.GeneratedProtocolMessageType('PodSpawnRequest', (_message.Message,), {
+    'DESCRIPTOR' : _SPAWNREQUEST_PODSPAWNREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.SpawnRequest.PodSpawnRequest)
+    })
+  ,
+
+  'MutablepodSpawnRequest' : _reflection.GeneratedProtocolMessageType('MutablepodSpawnRequest', (_message.Message,), {
+    'DESCRIPTOR' : _SPAWNREQUEST_MUTABLEPODSPAWNREQUEST,
+    '__module__' : 'jina_pb2'
+    # @@protoc_insertion_point(class_scope:jina.SpawnRequest.MutablepodSpawnRequest)
+    })
+  ,
+  'DESCRIPTOR' : _SPAWNREQUEST,
+  '__module__' : 'jina_pb2'
+  # @@protoc_insertion_point(class_scope:jina.SpawnRequest)
+  })
+_sym_db.RegisterMessage(SpawnRequest)
+_sym_db.RegisterMessage(SpawnRequest.PeaSpawnRequest)
+_sym_db.RegisterMessage(SpawnRequest.PodSpawnRequest)
+_sym_db.RegisterMessage(SpawnRequest.MutablepodSpawnRequest)
+
+
+_REQUEST_CONTROLREQUEST_ARGSENTRY._options = None
+
+_JINARPC = _descriptor.ServiceDescriptor(
+  name='JinaRPC',
+  full_name='jina.JinaRPC',
+  file=DESCRIPTOR,
+  index=0,
+  serialized_options=None,
+  serialized_start=2712,
+  serialized_end=2818,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Call',
+    full_name='jina.JinaRPC.Call',
+    index=0,
+    containing_service=None,
+    input_type=_REQUEST,
+    output_type=_REQUEST,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='Spawn',
+    full_name='jina.JinaRPC.Spawn',
+    index=1,
+    containing_service=None,
+    input_type=_SPAWNREQUEST,
+    output_type=_SPAWNREQUEST,
+    serialized_options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_JINARPC)
+
+DESCRIPTOR.services_by_name['JinaRPC'] = _JINARPC
+
+# @@protoc_insertion_point(module_scope)
@@ -4,36 +4,123 @@ __license__ = "Apache-2.0"
 import numpy as np
 
 
+def pack_tokens(data, mask_2d):
+    """Drop the padded positions of ``data`` and return the valid tokens as one packed array
+
+    :param data: a `B x S x D` array of token embeddings
+    :param mask_2d: a `B x S` mask, non-zero for the valid tokens
+    :return: a tuple of the `sum(mask) x D` packed array, the start offset of each sequence
+        inside it and the number of valid tokens per sequence
+    """
+    valid = mask_2d.astype(bool)
+    seq_lens = valid.sum(axis=1)
+    offsets = np.concatenate(([0], np.cumsum(seq_lens)[:-1]))
+    return data[valid], offsets, seq_lens
+
+
+def _segment_reduce(ufunc, data, mask_2d):
+    packed, offsets, seq_lens = pack_tokens(data, mask_2d)
+    output = np.zeros((mask_2d.shape[0], data.shape[2]), dtype=data.dtype)
+    valid = seq_lens > 0
+    if valid.any():
+        # reduceat cannot express zero-length segments (it would read into the next
+        # sequence, or past the end for a trailing one). Rows without any valid token
+        # contribute nothing to the packed array, so the offsets of the non-empty rows
+        # still delimit exactly their own segments; the empty rows stay all-zero.
+        output[valid] = ufunc.reduceat(packed, offsets[valid], axis=0)
+    return output, seq_lens
+
+
 def reduce_mean(data, mask_2d):
-    emb_dim = data.shape[2]
-    mask = np.tile(mask_2d, (emb_dim, 1, 1))
-    mask = np.rollaxis(mask, 0, 3)
-    output = mask * data
-    return np.sum(output, axis=1) / np.sum(mask, axis=1)
+    output, seq_lens = _segment_reduce(np.add, data, mask_2d)
+    return output / np.maximum(seq_lens, 1)[:, np.newaxis]
 
 
 def reduce_max(data, mask_2d):
-    emb_dim = data.shape[2]
-    mask = np.tile(mask_2d, (emb_dim, 1, 1))
-    mask = np.rollaxis(mask, 0, 3)
-    output = mask * data
-    neg_mask = (mask_2d - 1) * 1e10
-    neg_mask = np.tile(neg_mask, (emb_dim, 1, 1))
-    neg_mask = np.rollaxis(neg_mask, 0, 3)
-    output += neg_mask
-    return np.max(output, axis=1)
+    output, _ = _segment_reduce(np.maximum, data, mask_2d)
+    return output
 
 
 def reduce_min(data, mask_2d):
-    emb_dim = data.shape[2]
-    mask = np.tile(mask_2d, (emb_dim, 1, 1))
-    mask = np.rollaxis(mask, 0, 3)
-    output = mask * data
-    neg_mask = (mask_2d - 1) * (-1e10)
-    neg_mask = np.tile(neg_mask, (emb_dim, 1, 1))
-    neg_mask = np.rollaxis(neg_mask, 0, 3)
-    output += neg_mask
-    return np.min(output, axis=1)
+    output, _ = _segment_reduce(np.minimum, data, mask_2d)
+    return output
+
+
+_numba_pool_fns = None
+
+
+def get_numba_pool_fn(pool_strategy: str):
+    """Return a numba-compiled single-pass pooling function for ``pool_strategy``, or
+    ``None`` when numba is not installed or the strategy has no kernel.
+
+    Unlike the numpy helpers above, the kernels fuse the masking, the reduction and
+    (for ``mean``) the division into one pass over the `B x S x D` buffer and
+    parallelize over the batch dim.
+    """
+    global _numba_pool_fns
+    if _numba_pool_fns is None:
+        try:
+            _numba_pool_fns = _compile_numba_pool_fns()
+        except ImportError:
+            _numba_pool_fns = {}
+    return _numba_pool_fns.get(pool_strategy)
+
+
+def _compile_numba_pool_fns():
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mean_kernel(data, mask_2d, out):
+        for b in prange(data.shape[0]):
+            cnt = 0
+            for d in range(data.shape[2]):
+                out[b, d] = 0.
+            for t in range(data.shape[1]):
+                if mask_2d[b, t]:
+                    cnt += 1
+                    for d in range(data.shape[2]):
+                        out[b, d] += data[b, t, d]
+            denom = cnt if cnt > 0 else 1
+            for d in range(data.shape[2]):
+                out[b, d] /= denom
+
+    # no fastmath on the max/min kernels: it lets LLVM assume no infinities, which
+    # breaks the comparisons against the +-inf initializers below
+    @njit(parallel=True, cache=True)
+    def _max_kernel(data, mask_2d, out):
+        for b in prange(data.shape[0]):
+            for d in range(data.shape[2]):
+                out[b, d] = -np.inf
+            for t in range(data.shape[1]):
+                if mask_2d[b, t]:
+                    for d in range(data.shape[2]):
+                        if data[b, t, d] > out[b, d]:
+                            out[b, d] = data[b, t, d]
+
+    @njit(parallel=True, cache=True)
+    def _min_kernel(data, mask_2d, out):
+        for b in prange(data.shape[0]):
+            for d in range(data.shape[2]):
+                out[b, d] = np.inf
+            for t in range(data.shape[1]):
+                if mask_2d[b, t]:
+                    for d in range(data.shape[2]):
+                        if data[b, t, d] < out[b, d]:
+                            out[b, d] = data[b, t, d]
+
+    def _as_pool_fn(kernel):
+        def _fn(data, mask_2d):
+            out = np.empty((data.shape[0], data.shape[2]), dtype=data.dtype)
+            kernel(data, mask_2d.astype(np.bool_), out)
+            return out
+
+        return _fn
+
+    return {
+        'mean': _as_pool_fn(_mean_kernel),
+        'max': _as_pool_fn(_max_kernel),
+        'min': _as_pool_fn(_min_kernel)
+    }
 
 
 def reduce_cls(data, mask_2d, cls_pos='head'):
@@ -44,12 +131,10 @@ def reduce_cls(data, mask_2d, cls_pos='head'):
 def prune_mask(mask, cls_pos='head'):
     result = np.zeros(mask.shape)
     if cls_pos == 'head':
-        mask_row = np.zeros((1, mask.shape[1]))
-        mask_row[0, 0] = 1
-        result = np.tile(mask_row, (mask.shape[0], 1))
+        result[:, 0] = 1
     elif cls_pos == 'tail':
-        for num_tokens in np.sum(mask, axis=1).tolist():
-            result[num_tokens - 1] = 1
+        seq_lens = np.sum(mask, axis=1).astype(int)
+        result[np.arange(mask.shape[0]), seq_lens - 1] = 1
     else:
         raise NotImplementedError
     return result
@@ -1,9 +1,47 @@
 import unittest
+from collections import OrderedDict
 
+import numpy as np
+
+from jina.executors.encoders.nlp import transformer
 from jina.executors.encoders.nlp.transformer import TransformerTFEncoder, TransformerTorchEncoder
 from . import NlpTestCase
 
 
+class _DummyTokenizer:
+    def __call__(self, texts, **kwargs):
+        return {'input_ids': [[1, len(t)] for t in texts]}
+
+
+class TokenCacheTestCase(unittest.TestCase):
+    def _get_encoder(self):
+        encoder = transformer.BaseTransformerEncoder.__new__(transformer.BaseTransformerEncoder)
+        encoder.max_length = 8
+        encoder.tokenizer = _DummyTokenizer()
+        encoder._tok_cache = OrderedDict()
+        return encoder
+
+    def test_eviction_keeps_batch_entries(self):
+        encoder = self._get_encoder()
+        old_capacity = transformer._TOK_CACHE_CAPACITY
+        transformer._TOK_CACHE_CAPACITY = 4
+        try:
+            # fill the cache to capacity, 'txt0' becoming the oldest entry
+            encoder._tokenize(['txt{}'.format(i) for i in range(4)])
+            # a batch mixing the oldest hit with a fresh miss must not evict the hit
+            # before the batch is assembled
+            token_ids = encoder._tokenize(['txt0', 'brand-new'])
+            np.testing.assert_array_equal(token_ids[0], [1, 4])
+            np.testing.assert_array_equal(token_ids[1], [1, 9])
+            self.assertLessEqual(len(encoder._tok_cache), 4)
+            # a batch larger than the whole cache still returns every row
+            token_ids = encoder._tokenize(['other{}'.format(i) for i in range(6)])
+            self.assertTrue(all(t is not None for t in token_ids))
+            self.assertLessEqual(len(encoder._tok_cache), 4)
+        finally:
+            transformer._TOK_CACHE_CAPACITY = old_capacity
+
+
 class PytorchTestCase(NlpTestCase):
     def _get_encoder(self, metas):
         return TransformerTorchEncoder(
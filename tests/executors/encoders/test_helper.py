@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from jina.executors.encoders.helper import (
+    get_numba_pool_fn, prune_mask, reduce_max, reduce_mean, reduce_min)
+
+
+def _dense_reduce(data, mask_2d, op):
+    """Reference implementation: loop over the batch, pool the valid tokens per row."""
+    output = np.zeros((data.shape[0], data.shape[2]), dtype=data.dtype)
+    for b in range(data.shape[0]):
+        tokens = data[b][mask_2d[b].astype(bool)]
+        if tokens.shape[0]:
+            output[b] = op(tokens, axis=0)
+    return output
+
+
+class HelperTestCase(unittest.TestCase):
+    def _random_batch(self, batch_size=5, seq_len=7, dim=3):
+        rs = np.random.RandomState(42)
+        data = rs.randn(batch_size, seq_len, dim).astype(np.float32)
+        seq_lens = rs.randint(1, seq_len + 1, size=batch_size)
+        mask = (np.arange(seq_len)[np.newaxis, :] < seq_lens[:, np.newaxis]).astype(np.float32)
+        return data, mask
+
+    def test_reduce_matches_dense(self):
+        data, mask = self._random_batch()
+        np.testing.assert_allclose(reduce_mean(data, mask), _dense_reduce(data, mask, np.mean),
+                                   rtol=1e-6)
+        np.testing.assert_allclose(reduce_max(data, mask), _dense_reduce(data, mask, np.max))
+        np.testing.assert_allclose(reduce_min(data, mask), _dense_reduce(data, mask, np.min))
+
+    def test_reduce_empty_rows(self):
+        data, mask = self._random_batch()
+        # all-pad rows in the middle and at the tail of the batch must pool to zero
+        # without leaking tokens from the neighbouring rows
+        mask[2] = 0
+        mask[-1] = 0
+        for reduce_fn, op in ((reduce_mean, np.mean), (reduce_max, np.max), (reduce_min, np.min)):
+            result = reduce_fn(data, mask)
+            np.testing.assert_allclose(result, _dense_reduce(data, mask, op), rtol=1e-6)
+            np.testing.assert_array_equal(result[2], 0)
+            np.testing.assert_array_equal(result[-1], 0)
+
+    def test_prune_mask(self):
+        _, mask = self._random_batch()
+        head = prune_mask(mask, 'head')
+        self.assertTrue((head[:, 0] == 1).all())
+        self.assertEqual(head.sum(), mask.shape[0])
+        tail = prune_mask(mask, 'tail')
+        seq_lens = mask.sum(axis=1).astype(int)
+        self.assertTrue((tail[np.arange(mask.shape[0]), seq_lens - 1] == 1).all())
+        self.assertEqual(tail.sum(), mask.shape[0])
+
+    def test_numba_kernels_match_numpy(self):
+        data, mask = self._random_batch()
+        for strategy, reduce_fn in (('mean', reduce_mean), ('max', reduce_max), ('min', reduce_min)):
+            pool_fn = get_numba_pool_fn(strategy)
+            if pool_fn is None:
+                self.skipTest('numba is not installed')
+            np.testing.assert_allclose(pool_fn(data, mask), reduce_fn(data, mask), rtol=1e-5)
+
+
+if __name__ == '__main__':
+    unittest.main()